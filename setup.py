@@ -1,5 +1,24 @@
+import os
+from pathlib import Path
+
 from setuptools import setup, find_packages
 
+README = Path(__file__).with_name("README.md")
+
+# Opt-in native build of the response serializers with mypyc. pyproject.toml
+# selects the Poetry build backend, so pip/PEP 517 builds never run this file;
+# the compiled module is only produced by invoking setup.py directly:
+#
+#     pip install mypy
+#     TABTABTAB_LIB_MYPYC=1 python setup.py build_ext --inplace
+#
+# Without the compiled module, the pure-Python one is imported as usual.
+ext_modules = []
+if os.environ.get("TABTABTAB_LIB_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(["tabtabtab_lib/responses.py"])
+
 setup(
     name="tabtabtab-lib",
     version="0.1.0",
@@ -7,15 +26,17 @@ setup(
     author="TabTabTabAI",  # Assuming author name
     author_email="",  # Placeholder
     description="Core library for TabTabTab functionality.",
-    long_description=open("README.md").read(),
+    long_description=README.read_text(encoding="utf-8") if README.exists() else "",
     long_description_content_type="text/markdown",
     url="https://github.com/tabtabtabai/tabtabtab-lib",  # Repository URL
     # Add any dependencies here if needed, e.g., install_requires=['requests']
-    install_requires=[],
+    install_requires=["orjson>=3.8"],
+    extras_require={"msgpack": ["msgpack>=1.0"]},
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",  # Choose appropriate license
         "Operating System :: OS Independent",
     ],
     python_requires=">=3.11",
+    ext_modules=ext_modules,
 )
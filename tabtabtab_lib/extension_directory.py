@@ -1,9 +1,21 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
-from typing import List, Type
-from enum import Enum, auto
+from typing import Dict, FrozenSet, Iterable, Type
+from enum import Enum
 
 from .extension_interface import ExtensionInterface
 
+__all__ = [
+    "BaseExtensionDependencies",
+    "BaseExtensionID",
+    "clear_registry",
+    "ExtensionDescriptor",
+    "get_descriptor",
+    "register",
+    "register_all",
+]
+
 
 class BaseExtensionID(Enum):
     """
@@ -21,9 +33,76 @@ class BaseExtensionDependencies(Enum):
     pass
 
 
-@dataclass
+@dataclass(frozen=True)
 class ExtensionDescriptor:
     extension_id: BaseExtensionID
     description: str
-    dependencies: List[BaseExtensionDependencies]
+    dependencies: FrozenSet[BaseExtensionDependencies]
     extension_class: Type[ExtensionInterface]
+
+    def __post_init__(self) -> None:
+        # Accept any iterable (e.g. a list) for backwards compatibility.
+        if not isinstance(self.dependencies, frozenset):
+            object.__setattr__(self, "dependencies", frozenset(self.dependencies))
+
+
+# Registry of known extensions, keyed by extension ID.
+_DESCRIPTOR_BY_ID: Dict[BaseExtensionID, ExtensionDescriptor] = {}
+
+
+def _check_not_registered(
+    descriptor: ExtensionDescriptor,
+    registry: Dict[BaseExtensionID, ExtensionDescriptor],
+) -> None:
+    existing = registry.get(descriptor.extension_id)
+    if existing is not None and existing is not descriptor:
+        raise ValueError(f"Extension {descriptor.extension_id} is already registered")
+
+
+def register(descriptor: ExtensionDescriptor) -> None:
+    """
+    Registers an extension descriptor so it can be looked up by its ID.
+
+    Raises:
+        ValueError: If another descriptor is already registered under that ID.
+    """
+    _check_not_registered(descriptor, _DESCRIPTOR_BY_ID)
+    _DESCRIPTOR_BY_ID[descriptor.extension_id] = descriptor
+
+
+def register_all(descriptors: Iterable[ExtensionDescriptor]) -> None:
+    """
+    Registers every descriptor in descriptors, or none of them.
+
+    Intended to be called from the application startup hook, so extension
+    classes are imported and validated before the first copy/paste event
+    arrives instead of while handling it.
+
+    Raises:
+        ValueError: If any descriptor's ID is already registered to another
+                    descriptor, or used by another descriptor in the batch.
+                    Nothing is registered in that case.
+    """
+    batch: Dict[BaseExtensionID, ExtensionDescriptor] = {}
+    for descriptor in descriptors:
+        _check_not_registered(descriptor, _DESCRIPTOR_BY_ID)
+        _check_not_registered(descriptor, batch)
+        batch[descriptor.extension_id] = descriptor
+    _DESCRIPTOR_BY_ID.update(batch)
+
+
+def get_descriptor(extension_id: BaseExtensionID) -> ExtensionDescriptor:
+    """
+    Returns the descriptor registered for extension_id.
+
+    Raises:
+        KeyError: If no extension is registered under extension_id.
+    """
+    return _DESCRIPTOR_BY_ID[extension_id]
+
+
+def clear_registry() -> None:
+    """
+    Removes every registered descriptor. Mainly useful for tests.
+    """
+    _DESCRIPTOR_BY_ID.clear()
@@ -1,134 +1,175 @@
-import abc
-from typing import Any, Dict, Optional, Union, List
+from __future__ import annotations
+
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Union,
+)
 from dataclasses import dataclass
 from .sse_interface import SSESenderInterface
 from .llm_interface import LLMProcessorInterface
+
+# The response types live in .responses so that module can be compiled with
+# mypyc; they are re-exported here, where they were originally defined.
+from .responses import (
+    CopyResponse,
+    ImmediatePaste,
+    Notification,
+    NotificationStatus,
+    PasteKind,
+    PasteResponse,
+)
 import logging
-from enum import Enum
 
-log = logging.getLogger(__name__)
+import orjson
 
+log = logging.getLogger(__name__)
 
-class NotificationStatus(Enum):
-    """
-    Enum representing the status of an extension.
+__all__ = [
+    "CopyResponse",
+    "ExtensionInterface",
+    "ImmediatePaste",
+    "Notification",
+    "NotificationStatus",
+    "OnContextResponse",
+    "PasteKind",
+    "PasteResponse",
+    "StreamingOnContextResponse",
+    "iter_screenshot_chunks",
+]
+
+
+@dataclass(slots=True, frozen=True)
+class OnContextResponse:
     """
+    Response object returned by the on_context_request method.
 
-    PENDING = "pending"  # Extension is running normally
-    READY = "ready"  # Extension is disabled by user/system
-    ERROR = "error"  # Extension encountered an error
-
-@dataclass
-class Notification:
-    """
-    Data class representing a push notification.
+    Attributes:
+        contexts: The provided contexts. Any iterable is accepted, including a
+                  generator; the framework iterates it exactly once.
     """
 
-    request_id: str
-    title: str
-    detail: str
-    content: str
-    status: NotificationStatus
-
-    def to_dict(self) -> Dict[str, str]:
+    @dataclass(slots=True, frozen=True)
+    class ExtensionContext:
+        """
+        Object to describe the context provided by an extension.
         """
-        Serializes the Notification to a JSON-compatible dictionary.
 
-        Returns:
-            A dictionary containing the notification data.
-        """
-        return {
-            "notification_request_id": self.request_id,
-            "notification_title": self.title,
-            "notification_detail": self.detail,
-            "notification_content": self.content,
-            "notification_status": self.status.value,
-        }
-
-@dataclass
-class ImmediatePaste:
-    """
-    Data class representing an immediate paste.
-    """
+        description: str
+        context: str
 
-    content: str
+    contexts: Iterable[ExtensionContext] = ()
 
-    def to_dict(self) -> Dict[str, str]:
+    async def iter_contexts(self) -> AsyncIterator[ExtensionContext]:
         """
-        Serializes the ImmediatePaste to a JSON-compatible dictionary.
+        Yields every context in `contexts`.
+
+        `contexts` may be single-use, so this should be called only once.
         """
-        return {"immediate_paste_content": self.content}
+        for context in self.contexts:
+            yield context
 
 
-@dataclass
-class CopyResponse:
+@dataclass(slots=True, frozen=True)
+class StreamingOnContextResponse(OnContextResponse):
     """
-    Response object returned by the on_copy method.
+    OnContextResponse whose contexts are partly produced asynchronously.
+
+    Lets the framework start sending early contexts before later ones have
+    been computed. An async iterator has no schema, so unlike
+    OnContextResponse this type cannot be validated or serialized by pydantic.
 
     Attributes:
-        notification: Notification object to be sent to the user.
+        contexts_async: Async iterator of further contexts, consumed after
+                        `contexts`.
     """
 
-    notification: Notification
+    contexts_async: Optional[AsyncIterator[OnContextResponse.ExtensionContext]] = None
 
-    def to_dict(self) -> Dict[str, str]:
-        """
-        Serializes the CopyResponse to a JSON-compatible dictionary.
+    async def iter_contexts(
+        self,
+    ) -> AsyncIterator[OnContextResponse.ExtensionContext]:
         """
-        dict = {}
-        if self.notification:
-            dict["notification"] = self.notification.to_dict()
+        Yields every context from `contexts`, then from `contexts_async`.
 
-        return dict
+        Both sources may be single-use, so this should be called only once.
+        """
+        for context in self.contexts:
+            yield context
+        if self.contexts_async is not None:
+            async for context in self.contexts_async:
+                yield context
 
 
-@dataclass
-class PasteResponse:
-    """
-    Response object returned by the on_paste method.
+def iter_screenshot_chunks(
+    screenshot_data: Union[bytes, memoryview], chunk_size: int = 64 * 1024
+) -> Iterator[memoryview]:
     """
+    Splits screenshot data into consecutive chunks without copying it.
 
-    paste: Union[ImmediatePaste, Notification]
+    Args:
+        screenshot_data: The 'screenshot_data' value from an event context.
+        chunk_size: Maximum number of bytes per chunk.
 
-    def to_dict(self) -> Dict[str, str]:
-        """
-        Serializes the PasteResponse to a JSON-compatible dictionary.
-        """
-        dict = {}
-        if isinstance(self.paste, Notification):
-            dict["notification"] = self.paste.to_dict()
-        elif isinstance(self.paste, ImmediatePaste):
-            dict["immediate_paste"] = self.paste.to_dict()
-
-        return dict
+    Returns:
+        An iterator of memoryview slices over the original buffer.
 
-
-@dataclass
-class OnContextResponse:
-    """
-    Response object returned by the on_context_request method.
+    Raises:
+        ValueError: If chunk_size is not positive. Raised on the call itself,
+                    not when iteration starts.
     """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    view = memoryview(screenshot_data).cast("B")
+    return (
+        view[start : start + chunk_size] for start in range(0, len(view), chunk_size)
+    )
 
-    @dataclass
-    class ExtensionContext:
-        """
-        Object to describe the context provided by an extension.
-        """
 
-        description: str
-        context: str
+# SSE frame header for push notifications; the JSON body and b"\n\n" follow.
+_NOTIFICATION_FRAME_PREFIX = b"event: extension_notification\ndata: "
 
-    contexts: List[ExtensionContext]
+# Event hooks every concrete extension class must implement.
+_REQUIRED_HOOKS = ("on_context_request", "on_copy", "on_paste")
 
 
-class ExtensionInterface(abc.ABC):
+class ExtensionInterface:
     """
-    Abstract Base Class defining the interface for all TabTabTab extensions.
+    Base class defining the interface for all TabTabTab extensions.
 
     Each extension module must contain a class that inherits from this
-    interface and implements all its abstract methods.
+    interface and implements on_context_request, on_copy and on_paste.
+    The contract is checked once when the subclass is defined rather than
+    on every instantiation. Intermediate base classes that leave hooks
+    unimplemented must be declared with `abstract=True`:
+
+        class MyBaseExtension(ExtensionInterface, abstract=True):
+            ...
     """
 
+    # Set per class by __init_subclass__ once its hooks have been verified.
+    _is_concrete_extension = False
+
+    def __init_subclass__(cls, abstract: bool = False, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._is_concrete_extension = False
+        if abstract:
+            return
+        missing = [
+            name
+            for name in _REQUIRED_HOOKS
+            if getattr(cls, name, None) in (None, getattr(ExtensionInterface, name))
+        ]
+        if missing:
+            raise TypeError(
+                f"Extension class {cls.__name__} must implement: {', '.join(missing)}"
+            )
+        cls._is_concrete_extension = True
+
     def __init__(
         self,
         sse_sender: SSESenderInterface,
@@ -144,13 +185,23 @@ class ExtensionInterface(abc.ABC):
             llm_processor: An object conforming to the LLMProcessorInterface
                            for interacting with language models.
         """
+        if not self._is_concrete_extension:
+            raise TypeError(
+                f"Can't instantiate abstract extension class {type(self).__name__}"
+            )
         self.api_key: Optional[str] = None
         self.llm_processor = llm_processor  # Store the injected LLM processor
         self.sse_sender = sse_sender  # Store the injected SSE sender
         self.extension_id = extension_id
-        log.info(f"[{self.extension_id}] Initializing...")
+        # Closing fragment appended to every outgoing notification payload.
+        self._extension_id_json_suffix = (
+            b',"extension_id":' + orjson.dumps(extension_id) + b"}"
+        )
+        # "[<extension_id>] " prefix for this extension's log messages, built
+        # once here; it is passed as a %s argument so logging formats it lazily.
+        self._log_prefix = f"[{extension_id}] "
+        log.info("%sInitializing...", self._log_prefix)
 
-    @abc.abstractmethod
     async def on_context_request(
         self, source_extension_id: str, context_query: Dict[str, Any]
     ) -> Optional[OnContextResponse]:
@@ -167,7 +218,7 @@ class ExtensionInterface(abc.ABC):
                 - 'request_id': str, Unique identifier for this specific request
                 - 'window_info': Dict[str, Any], Dictionary containing information about the active window; contains the url if the active window is a browser
                 - 'screenshot_provided': bool, Boolean indicating if a screenshot is available
-                - 'screenshot_data': Optional[bytes], Raw image data when a screenshot is provided
+                - 'screenshot_data': Optional[Union[bytes, memoryview]], Raw image data when a screenshot is provided; may be a zero-copy memoryview, so call bytes() on it only if an owned copy is needed
                 - 'session_contents': List[SessionContent], Contents of the current session
                 - 'hint': str, Parsed hint information
                 - 'sticky_hint': str, Persistent hint information
@@ -178,7 +229,6 @@ class ExtensionInterface(abc.ABC):
         """
         pass
 
-    @abc.abstractmethod
     async def on_copy(self, context: Dict[str, Any]) -> Optional[CopyResponse]:
         """
         Handles a 'copy' event triggered by the user.
@@ -198,7 +248,7 @@ class ExtensionInterface(abc.ABC):
                      - 'window_info': Dict[str, Any], Dictionary containing information about the active window; contains the url if the active window is a browser
                      - 'screenshot_provided': bool, Boolean indicating if a screenshot is available
                      - 'selected_text': Optional[str], Text that was selected by the user
-                     - 'screenshot_data': Optional[bytes] (Raw image data if screenshot_provided is True)
+                     - 'screenshot_data': Optional[Union[bytes, memoryview]] (Raw image data if screenshot_provided is True; may be a zero-copy memoryview, so call bytes() on it only if an owned copy is needed)
 
         Returns:
             A CopyResponse object, potentially containing a message to notify
@@ -207,13 +257,12 @@ class ExtensionInterface(abc.ABC):
         """
         pass
 
-    @abc.abstractmethod
     async def on_paste(self, context: Dict[str, Any]) -> Optional[PasteResponse]:
         """
         Handles a 'paste' event triggered by the user.
 
         This method is called when the framework detects a paste action relevant
-        to potentially triggering extensions. The extension can analyze the context 
+        to potentially triggering extensions. The extension can analyze the context
         and decide whether to provide custom content to be pasted.
 
         Args:
@@ -224,7 +273,7 @@ class ExtensionInterface(abc.ABC):
                      - 'request_id': str, Unique identifier for this specific request
                      - 'window_info': Dict[str, Any], Dictionary containing information about the active window; contains the url if the active window is a browser
                      - 'screenshot_provided': bool, Boolean indicating if a screenshot is available
-                     - 'screenshot_data': Optional[bytes], Raw image data when a screenshot is provided
+                     - 'screenshot_data': Optional[Union[bytes, memoryview]], Raw image data when a screenshot is provided; may be a zero-copy memoryview, so call bytes() on it only if an owned copy is needed
                      - 'session_contents': List[SessionContent], Contents of the current session
                      - 'hint': str, Parsed hint information
                      - 'sticky_hint': str, Persistent hint information
@@ -242,8 +291,59 @@ class ExtensionInterface(abc.ABC):
         """
         Sends a push notification to the user.
         """
-        notification_dict = notification.to_dict()
-        notification_dict["extension_id"] = self.extension_id
-        await self.sse_sender.send_event(
-            device_id, "extension_notification", notification_dict
+        if self._sender_writes_frames():
+            await self.sse_sender.send_event_raw(
+                device_id, self._notification_frame(notification)
+            )
+        else:
+            await self.sse_sender.send_event(
+                device_id,
+                "extension_notification",
+                self._notification_data(notification),
+            )
+
+    def send_push_notification_nowait(
+        self, device_id: str, notification: Notification
+    ) -> None:
+        """
+        Sends a push notification to the user without awaiting delivery.
+
+        Intended for fire-and-forget status updates: there is no backpressure
+        and delivery errors are only logged. Must be called from within the
+        running event loop.
+        """
+        if self._sender_writes_frames(nowait=True):
+            self.sse_sender.send_event_raw_nowait(
+                device_id, self._notification_frame(notification)
+            )
+        else:
+            self.sse_sender.send_event_nowait(
+                device_id,
+                "extension_notification",
+                self._notification_data(notification),
+            )
+
+    def _sender_writes_frames(self, nowait: bool = False) -> bool:
+        # The default send_event_raw only parses the frame back into a dict for
+        # send_event, so senders that don't override it get the dict directly.
+        sender_type = type(self.sse_sender)
+        if sender_type.send_event_raw is not SSESenderInterface.send_event_raw:
+            return True
+        return (
+            nowait
+            and sender_type.send_event_raw_nowait
+            is not SSESenderInterface.send_event_raw_nowait
+        )
+
+    def _notification_data(self, notification: Notification) -> Dict[str, Any]:
+        return {**notification.to_dict(), "extension_id": self.extension_id}
+
+    def _notification_frame(self, notification: Notification) -> bytes:
+        # Splice the pre-encoded extension_id into the notification object
+        # rather than rebuilding and re-encoding a dict on every send.
+        return (
+            _NOTIFICATION_FRAME_PREFIX
+            + notification.to_json()[:-1]
+            + self._extension_id_json_suffix
+            + b"\n\n"
         )
@@ -6,7 +6,7 @@ from .llm import LLMModel
 
 @dataclass
 class LLMContext:
-    image: Optional[bytes] = None
+    image: Optional[Union[bytes, memoryview]] = None
     text: Optional[str] = None
 
 
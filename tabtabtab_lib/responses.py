@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Optional, Union, Literal
+from dataclasses import dataclass, field
+from enum import Enum
+import json
+
+import orjson
+
+__all__ = [
+    "CopyResponse",
+    "ImmediatePaste",
+    "Notification",
+    "NotificationStatus",
+    "PasteKind",
+    "PasteResponse",
+]
+
+
+def _packb(obj: Any) -> bytes:
+    """
+    Encodes obj to MessagePack bytes.
+
+    bytes values (e.g. screenshot data) are stored as native binary rather
+    than base64 text as in JSON. msgpack is an optional dependency, so it is
+    imported on first use rather than at module load.
+    """
+    try:
+        import msgpack
+    except ImportError as e:
+        raise ImportError(
+            "MessagePack encoding requires the optional msgpack dependency; "
+            "install tabtabtab-lib[msgpack]"
+        ) from e
+    packed: bytes = msgpack.packb(obj, use_bin_type=True)
+    return packed
+
+
+def _json_str(value: str) -> bytes:
+    """
+    Encodes a string as a JSON string literal.
+
+    orjson rejects strings that are not valid UTF-8, such as ones containing
+    lone surrogates; those fall back to the stdlib encoder, which escapes them.
+    """
+    try:
+        return orjson.dumps(value)
+    except TypeError:
+        return json.dumps(value).encode()
+
+
+class NotificationStatus(Enum):
+    """
+    Enum representing the status of an extension.
+    """
+
+    PENDING = "pending"  # Extension is running normally
+    READY = "ready"  # Extension is disabled by user/system
+    ERROR = "error"  # Extension encountered an error
+
+
+# Pre-encoded JSON for each status and the fixed wire layout of each response
+# type, so to_json only has to encode string fields and splice nested bytes.
+_STATUS_JSON: Dict[NotificationStatus, bytes] = {
+    status: orjson.dumps(status.value) for status in NotificationStatus
+}
+_NOTIFICATION_JSON_TEMPLATE = (
+    b'{"notification_request_id":%b,'
+    b'"notification_title":%b,'
+    b'"notification_detail":%b,'
+    b'"notification_content":%b,'
+    b'"notification_status":%b}'
+)
+_IMMEDIATE_PASTE_JSON_TEMPLATE = b'{"immediate_paste_content":%b}'
+_BOOL_JSON: Dict[bool, bytes] = {True: b"true", False: b"false"}
+# Responses without a payload serialize to one of two constant documents.
+_TASK_ONLY_JSON: Dict[bool, bytes] = {
+    flag: b'{"is_processing_task":%b}' % _BOOL_JSON[flag] for flag in (True, False)
+}
+_COPY_RESPONSE_JSON_TEMPLATE = b'{"notification":%b,"is_processing_task":%b}'
+
+
+@dataclass(slots=True, frozen=True)
+class Notification:
+    """
+    Data class representing a push notification.
+    """
+
+    request_id: str
+    title: str
+    detail: str
+    content: str
+    status: NotificationStatus
+
+    def to_dict(self) -> Dict[str, str]:
+        """
+        Serializes the Notification to a JSON-compatible dictionary.
+
+        Returns:
+            A dictionary containing the notification data.
+        """
+        return {
+            "notification_request_id": self.request_id,
+            "notification_title": self.title,
+            "notification_detail": self.detail,
+            "notification_content": self.content,
+            "notification_status": self.status.value,
+        }
+
+    def to_json(self) -> bytes:
+        """
+        Serializes the Notification to JSON-encoded bytes.
+
+        Produces the same document as to_dict, filled into a prebuilt template.
+        """
+        return _NOTIFICATION_JSON_TEMPLATE % (
+            _json_str(self.request_id),
+            _json_str(self.title),
+            _json_str(self.detail),
+            _json_str(self.content),
+            _STATUS_JSON[self.status],
+        )
+
+    def to_msgpack(self) -> bytes:
+        """
+        Serializes the Notification to MessagePack-encoded bytes.
+
+        Requires the optional msgpack dependency.
+        """
+        return _packb(self.to_dict())
+
+
+@dataclass(slots=True, frozen=True)
+class ImmediatePaste:
+    """
+    Data class representing an immediate paste.
+    """
+
+    content: str
+
+    def to_dict(self) -> Dict[str, str]:
+        """
+        Serializes the ImmediatePaste to a JSON-compatible dictionary.
+        """
+        return {"immediate_paste_content": self.content}
+
+    def to_json(self) -> bytes:
+        """
+        Serializes the ImmediatePaste to JSON-encoded bytes.
+        """
+        return _IMMEDIATE_PASTE_JSON_TEMPLATE % _json_str(self.content)
+
+    def to_msgpack(self) -> bytes:
+        """
+        Serializes the ImmediatePaste to MessagePack-encoded bytes.
+
+        Requires the optional msgpack dependency.
+        """
+        return _packb(self.to_dict())
+
+
+@dataclass(slots=True, frozen=True)
+class CopyResponse:
+    """
+    Response object returned by the on_copy method.
+
+    Attributes:
+        notification: Optional Notification object to be sent to the user.
+        is_processing_task: Whether the extension started a background task
+                            for this copy event.
+    """
+
+    notification: Optional[Notification] = None
+    is_processing_task: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serializes the CopyResponse to a JSON-compatible dictionary.
+        """
+        dict: Dict[str, Any] = {}
+        if self.notification:
+            dict["notification"] = self.notification.to_dict()
+        dict["is_processing_task"] = self.is_processing_task
+
+        return dict
+
+    def to_json(self) -> bytes:
+        """
+        Serializes the CopyResponse to JSON-encoded bytes.
+        """
+        if not self.notification:
+            return _TASK_ONLY_JSON[self.is_processing_task]
+        return _COPY_RESPONSE_JSON_TEMPLATE % (
+            self.notification.to_json(),
+            _BOOL_JSON[self.is_processing_task],
+        )
+
+    def to_msgpack(self) -> bytes:
+        """
+        Serializes the CopyResponse to MessagePack-encoded bytes.
+
+        Requires the optional msgpack dependency.
+        """
+        return _packb(self.to_dict())
+
+
+PasteKind = Literal["notification", "paste"]
+
+# Serialized key for each PasteResponse.kind.
+_PASTE_KIND_KEY: Dict[PasteKind, str] = {
+    "notification": "notification",
+    "paste": "immediate_paste",
+}
+_PASTE_KIND_JSON_TEMPLATE: Dict[PasteKind, bytes] = {
+    kind: b'{"%b":%%b,"is_processing_task":%%b}' % key.encode()
+    for kind, key in _PASTE_KIND_KEY.items()
+}
+
+
+@dataclass(slots=True, frozen=True)
+class PasteResponse:
+    """
+    Response object returned by the on_paste method.
+
+    Attributes:
+        paste: The content to paste immediately, or a notification to show.
+        is_processing_task: Whether the extension started a background task
+                            for this paste event.
+        kind: Discriminator for `paste`, derived once at construction time.
+              None if `paste` is neither an ImmediatePaste nor a Notification.
+    """
+
+    paste: Union[ImmediatePaste, Notification]
+    is_processing_task: bool = False
+    kind: Optional[PasteKind] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        kind: Optional[PasteKind] = None
+        if isinstance(self.paste, Notification):
+            kind = "notification"
+        elif isinstance(self.paste, ImmediatePaste):
+            kind = "paste"
+        object.__setattr__(self, "kind", kind)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serializes the PasteResponse to a JSON-compatible dictionary.
+        """
+        dict: Dict[str, Any] = {}
+        if self.kind is not None:
+            dict[_PASTE_KIND_KEY[self.kind]] = self.paste.to_dict()
+        dict["is_processing_task"] = self.is_processing_task
+
+        return dict
+
+    def to_json(self) -> bytes:
+        """
+        Serializes the PasteResponse to JSON-encoded bytes.
+        """
+        if self.kind is None:
+            return _TASK_ONLY_JSON[self.is_processing_task]
+        return _PASTE_KIND_JSON_TEMPLATE[self.kind] % (
+            self.paste.to_json(),
+            _BOOL_JSON[self.is_processing_task],
+        )
+
+    def to_msgpack(self) -> bytes:
+        """
+        Serializes the PasteResponse to MessagePack-encoded bytes.
+
+        Requires the optional msgpack dependency.
+        """
+        return _packb(self.to_dict())
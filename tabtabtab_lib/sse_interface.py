@@ -1,5 +1,52 @@
 import abc
-from typing import Dict, Any
+import asyncio
+import logging
+from typing import Coroutine, Dict, Any, Set, Tuple, Union
+
+import orjson
+
+log = logging.getLogger(__name__)
+
+# Strong references to in-flight send_event_nowait tasks; the event loop only
+# keeps weak references, so unreferenced tasks could be collected mid-send.
+_background_tasks: Set["asyncio.Task[None]"] = set()
+
+
+def _on_background_send_done(task: "asyncio.Task[None]") -> None:
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        log.error("Background SSE send failed", exc_info=task.exception())
+
+
+def _spawn(coro: Coroutine[Any, Any, None]) -> None:
+    """
+    Runs coro as a task on the running event loop without awaiting it.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        coro.close()  # Avoid a "coroutine was never awaited" warning.
+        raise
+    task = loop.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_on_background_send_done)
+
+
+def _parse_sse_frame(payload: Union[bytes, memoryview]) -> Tuple[str, bytes]:
+    """
+    Splits an SSE frame into its event name and (joined) data field.
+    """
+    event_name = "message"
+    data_lines = []
+    for line in bytes(payload).splitlines():
+        field, _, value = line.partition(b":")
+        if value.startswith(b" "):
+            value = value[1:]
+        if field == b"event":
+            event_name = value.decode()
+        elif field == b"data":
+            data_lines.append(value)
+    return event_name, b"\n".join(data_lines)
 
 
 class SSESenderInterface(abc.ABC):
@@ -26,3 +73,58 @@ class SSESenderInterface(abc.ABC):
                   concrete implementation before sending.
         """
         pass
+
+    async def send_event_raw(
+        self, device_id: str, payload: Union[bytes, memoryview]
+    ) -> None:
+        """
+        Sends a fully framed SSE message to a specific device's SSE connection.
+
+        The payload already contains the complete wire frame, e.g.
+        b"event: extension_notification\ndata: {...}\n\n". Implementations
+        that write to the connection directly should override this and write
+        the payload as-is, without decoding or re-encoding. The default parses
+        the frame and forwards its event name and JSON data to `send_event`,
+        so senders that only implement `send_event` keep working.
+        Like `send_event`, this is called internally by the framework.
+
+        Args:
+            device_id: The target device ID.
+            payload: The encoded SSE frame, whose data field is a JSON object.
+        """
+        event_name, data = _parse_sse_frame(payload)
+        await self.send_event(device_id, event_name, orjson.loads(data))
+
+    def send_event_nowait(
+        self, device_id: str, event_name: str, data: Dict[str, Any]
+    ) -> None:
+        """
+        Schedules an event to be sent without waiting for it to be delivered.
+
+        The default implementation runs `send_event` as a task on the running
+        event loop, so it must be called from within one. Implementations
+        backed by an in-process queue can override this to enqueue directly.
+        There is no backpressure: use it only for fire-and-forget updates.
+
+        Args:
+            device_id: The target device ID.
+            event_name: The name of the SSE event (e.g., "extension_notification").
+            data: The event payload, as accepted by `send_event`.
+        """
+        _spawn(self.send_event(device_id, event_name, data))
+
+    def send_event_raw_nowait(
+        self, device_id: str, payload: Union[bytes, memoryview]
+    ) -> None:
+        """
+        Schedules a framed SSE message to be sent without waiting for delivery.
+
+        The raw-frame counterpart of `send_event_nowait`: the default runs
+        `send_event_raw` as a task on the running event loop, with the same
+        caveats (no backpressure, delivery errors are only logged).
+
+        Args:
+            device_id: The target device ID.
+            payload: The encoded SSE frame, as accepted by `send_event_raw`.
+        """
+        _spawn(self.send_event_raw(device_id, payload))
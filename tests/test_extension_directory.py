@@ -0,0 +1,111 @@
+from enum import Enum
+
+import pytest
+
+from tabtabtab_lib.extension_directory import (
+    ExtensionDescriptor,
+    clear_registry,
+    get_descriptor,
+    register,
+    register_all,
+)
+from tabtabtab_lib.extension_interface import ExtensionInterface
+
+
+class ExtensionID(Enum):
+    FIRST = "first"
+    SECOND = "second"
+    THIRD = "third"
+
+
+class Dependency(Enum):
+    LLM = "llm"
+
+
+def _descriptor(extension_id, description="test extension"):
+    return ExtensionDescriptor(
+        extension_id=extension_id,
+        description=description,
+        dependencies=[Dependency.LLM],
+        extension_class=ExtensionInterface,
+    )
+
+
+@pytest.fixture(autouse=True)
+def empty_registry():
+    clear_registry()
+    yield
+    clear_registry()
+
+
+def test_register_and_get_descriptor():
+    descriptor = _descriptor(ExtensionID.FIRST)
+
+    register(descriptor)
+
+    assert get_descriptor(ExtensionID.FIRST) is descriptor
+    assert descriptor.dependencies == frozenset({Dependency.LLM})
+
+
+def test_get_unregistered_descriptor_raises_key_error():
+    with pytest.raises(KeyError):
+        get_descriptor(ExtensionID.FIRST)
+
+
+def test_registering_same_descriptor_twice_is_allowed():
+    descriptor = _descriptor(ExtensionID.FIRST)
+
+    register(descriptor)
+    register(descriptor)
+
+    assert get_descriptor(ExtensionID.FIRST) is descriptor
+
+
+def test_register_rejects_duplicate_id():
+    register(_descriptor(ExtensionID.FIRST))
+
+    with pytest.raises(ValueError, match="already registered"):
+        register(_descriptor(ExtensionID.FIRST, "another extension"))
+
+
+def test_register_all_registers_every_descriptor():
+    first, second = _descriptor(ExtensionID.FIRST), _descriptor(ExtensionID.SECOND)
+
+    register_all([first, second])
+
+    assert get_descriptor(ExtensionID.FIRST) is first
+    assert get_descriptor(ExtensionID.SECOND) is second
+
+
+def test_register_all_is_atomic_on_duplicate_in_batch():
+    with pytest.raises(ValueError):
+        register_all(
+            [
+                _descriptor(ExtensionID.FIRST),
+                _descriptor(ExtensionID.SECOND),
+                _descriptor(ExtensionID.FIRST, "another extension"),
+            ]
+        )
+
+    for extension_id in ExtensionID:
+        with pytest.raises(KeyError):
+            get_descriptor(extension_id)
+
+
+def test_register_all_is_atomic_on_conflict_with_registry():
+    existing = _descriptor(ExtensionID.SECOND)
+    register(existing)
+
+    with pytest.raises(ValueError):
+        register_all(
+            [
+                _descriptor(ExtensionID.FIRST),
+                _descriptor(ExtensionID.SECOND, "another extension"),
+                _descriptor(ExtensionID.THIRD),
+            ]
+        )
+
+    assert get_descriptor(ExtensionID.SECOND) is existing
+    for extension_id in (ExtensionID.FIRST, ExtensionID.THIRD):
+        with pytest.raises(KeyError):
+            get_descriptor(extension_id)
@@ -0,0 +1,344 @@
+import asyncio
+import gc
+import json
+import weakref
+from typing import Any, Dict, List, Tuple, Union
+
+import pydantic
+import pytest
+
+from tabtabtab_lib import sse_interface
+from tabtabtab_lib.extension_interface import (
+    ExtensionInterface,
+    Notification,
+    NotificationStatus,
+    OnContextResponse,
+    StreamingOnContextResponse,
+    iter_screenshot_chunks,
+)
+from tabtabtab_lib.sse_interface import SSESenderInterface
+
+
+class DictOnlySender(SSESenderInterface):
+    """A sender written against the original dict-only contract."""
+
+    def __init__(self) -> None:
+        self.events: List[Tuple[str, str, Dict[str, Any]]] = []
+
+    async def send_event(
+        self, device_id: str, event_name: str, data: Dict[str, Any]
+    ) -> None:
+        self.events.append((device_id, event_name, data))
+
+
+class RawSender(DictOnlySender):
+    def __init__(self) -> None:
+        super().__init__()
+        self.frames: List[Tuple[str, bytes]] = []
+
+    async def send_event_raw(
+        self, device_id: str, payload: Union[bytes, memoryview]
+    ) -> None:
+        self.frames.append((device_id, bytes(payload)))
+
+
+class SampleExtension(ExtensionInterface):
+    async def on_context_request(self, source_extension_id, context_query):
+        return None
+
+    async def on_copy(self, context):
+        return None
+
+    async def on_paste(self, context):
+        return None
+
+
+NOTIFICATION = Notification(
+    request_id="req-1",
+    title="Title",
+    detail="Line one\nLine two",
+    content='Quote " and backslash \\',
+    status=NotificationStatus.READY,
+)
+
+
+@pytest.mark.asyncio
+async def test_send_push_notification_falls_back_to_send_event():
+    sender = DictOnlySender()
+    extension = SampleExtension(sender, None, "sample")
+
+    await extension.send_push_notification("device-1", NOTIFICATION)
+
+    assert sender.events == [
+        (
+            "device-1",
+            "extension_notification",
+            {**NOTIFICATION.to_dict(), "extension_id": "sample"},
+        )
+    ]
+
+
+@pytest.mark.asyncio
+async def test_dict_only_sender_skips_sse_frame_round_trip(monkeypatch):
+    def fail(payload):
+        raise AssertionError("frame was built and parsed for a dict-only sender")
+
+    monkeypatch.setattr(sse_interface, "_parse_sse_frame", fail)
+    sender = DictOnlySender()
+    extension = SampleExtension(sender, None, "sample")
+
+    await extension.send_push_notification("device-1", NOTIFICATION)
+    extension.send_push_notification_nowait("device-1", NOTIFICATION)
+    await asyncio.sleep(0)
+
+    assert len(sender.events) == 2
+
+
+@pytest.mark.asyncio
+async def test_send_push_notification_sends_sse_frame_to_raw_sender():
+    sender = RawSender()
+    extension = SampleExtension(sender, None, "sample")
+
+    await extension.send_push_notification("device-1", NOTIFICATION)
+
+    assert sender.events == []
+    [(device_id, frame)] = sender.frames
+    assert device_id == "device-1"
+    assert frame.startswith(b"event: extension_notification\ndata: ")
+    assert frame.endswith(b"\n\n")
+    assert frame.count(b"\n") == 3
+
+
+@pytest.mark.asyncio
+async def test_send_push_notification_nowait_matches_awaited_path():
+    awaited, fire_and_forget = RawSender(), RawSender()
+    await SampleExtension(awaited, None, "sample").send_push_notification(
+        "device-1", NOTIFICATION
+    )
+
+    SampleExtension(fire_and_forget, None, "sample").send_push_notification_nowait(
+        "device-1", NOTIFICATION
+    )
+    await asyncio.sleep(0)
+
+    assert fire_and_forget.frames == awaited.frames
+
+
+@pytest.mark.asyncio
+async def test_send_push_notification_nowait_falls_back_to_send_event():
+    sender = DictOnlySender()
+    extension = SampleExtension(sender, None, "sample")
+
+    extension.send_push_notification_nowait("device-1", NOTIFICATION)
+    await asyncio.sleep(0)
+
+    assert sender.events == [
+        (
+            "device-1",
+            "extension_notification",
+            {**NOTIFICATION.to_dict(), "extension_id": "sample"},
+        )
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status", list(NotificationStatus))
+@pytest.mark.parametrize(
+    "extension_id", ["sample", 'quote"d', "back\\slash", "caf\u00e9\n"]
+)
+async def test_notification_frame_is_valid_json_with_extension_id(status, extension_id):
+    sender = RawSender()
+    notification = Notification("req-1", "Title", "a\nb", 'c "d"', status)
+
+    await SampleExtension(sender, None, extension_id).send_push_notification(
+        "device-1", notification
+    )
+
+    [(_, frame)] = sender.frames
+    body = frame[len(b"event: extension_notification\ndata: ") : -2]
+    assert json.loads(body) == {
+        **notification.to_dict(),
+        "extension_id": extension_id,
+    }
+
+
+def test_missing_hook_raises_at_class_definition():
+    with pytest.raises(TypeError, match="on_context_request, on_paste"):
+
+        class Incomplete(ExtensionInterface):
+            async def on_copy(self, context):
+                return None
+
+
+def test_hook_set_to_none_counts_as_missing():
+    with pytest.raises(TypeError, match="on_paste"):
+
+        class DisabledPaste(SampleExtension):
+            on_paste = None
+
+
+def test_abstract_base_defers_validation_to_concrete_subclasses():
+    class PartialExtension(ExtensionInterface, abstract=True):
+        async def on_copy(self, context):
+            return None
+
+    with pytest.raises(TypeError, match="abstract extension class PartialExtension"):
+        PartialExtension(DictOnlySender(), None, "partial")
+
+    class CompleteExtension(PartialExtension):
+        async def on_context_request(self, source_extension_id, context_query):
+            return None
+
+        async def on_paste(self, context):
+            return None
+
+    assert CompleteExtension(DictOnlySender(), None, "complete").extension_id == (
+        "complete"
+    )
+
+
+@pytest.mark.asyncio
+async def test_base_hooks_return_none_when_called_via_super():
+    class DelegatingExtension(ExtensionInterface):
+        async def on_context_request(self, source_extension_id, context_query):
+            return await super().on_context_request(source_extension_id, {})
+
+        async def on_copy(self, context):
+            return await super().on_copy(context)
+
+        async def on_paste(self, context):
+            return await super().on_paste(context)
+
+    extension = DelegatingExtension(DictOnlySender(), None, "delegating")
+
+    assert await extension.on_context_request("tabtabtab_framework", {}) is None
+    assert await extension.on_copy({}) is None
+    assert await extension.on_paste({}) is None
+
+
+def test_interface_itself_cannot_be_instantiated():
+    with pytest.raises(TypeError, match="abstract extension class ExtensionInterface"):
+        ExtensionInterface(DictOnlySender(), None, "base")
+
+
+def test_abstract_subclass_of_concrete_extension_cannot_be_instantiated():
+    class AbstractVariant(SampleExtension, abstract=True):
+        pass
+
+    with pytest.raises(TypeError):
+        AbstractVariant(DictOnlySender(), None, "variant")
+
+
+def test_dynamically_created_extension_classes_can_be_collected():
+    extension_class = type("Dynamic", (SampleExtension,), {})
+    ref = weakref.ref(extension_class)
+
+    del extension_class
+    gc.collect()
+
+    assert ref() is None
+
+
+def _context(n: int) -> OnContextResponse.ExtensionContext:
+    return OnContextResponse.ExtensionContext(description=f"d{n}", context=f"c{n}")
+
+
+async def _collect(response: OnContextResponse) -> List[str]:
+    return [context.context async for context in response.iter_contexts()]
+
+
+def test_on_context_response_supports_pydantic_schema_generation():
+    adapter = pydantic.TypeAdapter(OnContextResponse)
+
+    assert "contexts" in adapter.json_schema()["properties"]
+    response = adapter.validate_python(
+        {"contexts": [{"description": "d0", "context": "c0"}]}
+    )
+    assert list(response.contexts) == [_context(0)]
+
+
+@pytest.mark.asyncio
+async def test_iter_contexts_yields_sync_contexts_then_async_contexts():
+    async def later():
+        yield _context(2)
+        yield _context(3)
+
+    response = StreamingOnContextResponse(
+        contexts=[_context(0), _context(1)], contexts_async=later()
+    )
+
+    assert await _collect(response) == ["c0", "c1", "c2", "c3"]
+
+
+@pytest.mark.asyncio
+async def test_iter_contexts_consumes_generator_sources_once():
+    produced = []
+
+    def early():
+        for n in range(2):
+            produced.append(n)
+            yield _context(n)
+
+    async def later():
+        for n in range(2, 4):
+            produced.append(n)
+            yield _context(n)
+
+    response = StreamingOnContextResponse(contexts=early(), contexts_async=later())
+
+    assert await _collect(response) == ["c0", "c1", "c2", "c3"]
+    assert produced == [0, 1, 2, 3]
+    assert await _collect(response) == []
+    assert produced == [0, 1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_iter_contexts_without_async_source():
+    response = OnContextResponse(contexts=(_context(n) for n in range(2)))
+
+    assert await _collect(response) == ["c0", "c1"]
+
+
+@pytest.mark.parametrize(
+    "size, chunk_size, expected_sizes",
+    [
+        (0, 4, []),
+        (3, 4, [3]),
+        (4, 4, [4]),
+        (5, 4, [4, 1]),
+        (8, 4, [4, 4]),
+        (8, 1, [1] * 8),
+    ],
+)
+def test_iter_screenshot_chunks_splits_at_chunk_boundaries(
+    size, chunk_size, expected_sizes
+):
+    data = bytes(range(size))
+
+    chunks = list(iter_screenshot_chunks(data, chunk_size))
+
+    assert [len(chunk) for chunk in chunks] == expected_sizes
+    assert b"".join(chunks) == data
+
+
+def test_iter_screenshot_chunks_slices_bytes_without_copying():
+    data = bytes(range(10))
+
+    for chunk in iter_screenshot_chunks(data, 4):
+        assert chunk.obj is data
+
+
+def test_iter_screenshot_chunks_accepts_memoryview():
+    data = bytes(range(10))
+    view = memoryview(data)[2:]
+
+    chunks = list(iter_screenshot_chunks(view, 3))
+
+    assert b"".join(chunks) == data[2:]
+    assert all(chunk.obj is data for chunk in chunks)
+
+
+@pytest.mark.parametrize("chunk_size", [0, -1])
+def test_iter_screenshot_chunks_rejects_chunk_size_at_call_time(chunk_size):
+    with pytest.raises(ValueError, match="chunk_size must be positive"):
+        iter_screenshot_chunks(b"data", chunk_size)
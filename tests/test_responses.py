@@ -0,0 +1,99 @@
+import json
+
+import pytest
+
+from tabtabtab_lib import responses
+from tabtabtab_lib.responses import (
+    CopyResponse,
+    ImmediatePaste,
+    Notification,
+    NotificationStatus,
+    PasteResponse,
+)
+
+# Strings that exercise JSON escaping: quotes, backslashes, control
+# characters, non-ASCII and astral-plane characters, and a lone surrogate,
+# which is not valid UTF-8.
+AWKWARD_STRINGS = [
+    "",
+    "plain",
+    'say "hi"',
+    "back\\slash",
+    "line\nbreak\ttab\r",
+    "\x00\x1f\x7f",
+    "caf\u00e9 \u65e5\u672c \U0001f600",
+    "</script>",
+    "lone \ud800 surrogate",
+]
+
+
+def _json_dumps(obj):
+    text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+    try:
+        return text.encode()
+    except UnicodeEncodeError:
+        # Lone surrogates can only be written as \u escapes.
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+
+NOTIFICATION = Notification(
+    request_id="req-1",
+    title="Title",
+    detail="Detail",
+    content="Content",
+    status=NotificationStatus.PENDING,
+)
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        NOTIFICATION,
+        ImmediatePaste("paste me"),
+        CopyResponse(NOTIFICATION, is_processing_task=True),
+        PasteResponse(ImmediatePaste("paste me")),
+    ],
+)
+def test_to_msgpack_round_trips_to_dict(response):
+    msgpack = pytest.importorskip("msgpack")
+
+    assert msgpack.unpackb(response.to_msgpack()) == response.to_dict()
+
+
+@pytest.mark.parametrize("status", list(NotificationStatus))
+@pytest.mark.parametrize("text", AWKWARD_STRINGS)
+def test_notification_to_json_matches_to_dict(status, text):
+    notification = Notification(
+        request_id=text, title=text, detail=text, content=text, status=status
+    )
+
+    assert notification.to_json() == _json_dumps(notification.to_dict())
+
+
+def _responses():
+    for text in AWKWARD_STRINGS:
+        paste = ImmediatePaste(text)
+        notification = Notification(text, text, text, text, NotificationStatus.ERROR)
+        yield paste
+        for is_processing_task in (False, True):
+            yield CopyResponse(notification, is_processing_task)
+            yield CopyResponse(None, is_processing_task)
+            yield PasteResponse(paste, is_processing_task)
+            yield PasteResponse(notification, is_processing_task)
+
+
+@pytest.mark.parametrize("response", list(_responses()))
+def test_response_to_json_matches_to_dict(response):
+    assert response.to_json() == _json_dumps(response.to_dict())
+
+
+@pytest.mark.skipif(
+    not responses.__file__.endswith(".py"),
+    reason="the mypyc build rejects ill-typed payloads at construction",
+)
+def test_paste_response_with_unknown_payload_serializes_task_flag_only():
+    response = PasteResponse(object(), is_processing_task=True)
+
+    assert response.kind is None
+    assert response.to_json() == b'{"is_processing_task":true}'
+    assert response.to_dict() == {"is_processing_task": True}
@@ -0,0 +1,68 @@
+import asyncio
+import logging
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from tabtabtab_lib import sse_interface
+from tabtabtab_lib.sse_interface import SSESenderInterface
+
+
+async def _drain() -> None:
+    # One iteration runs the send, the next its done-callback.
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+
+class RecordingSender(SSESenderInterface):
+    def __init__(self) -> None:
+        self.events: List[Tuple[str, str, Dict[str, Any]]] = []
+
+    async def send_event(
+        self, device_id: str, event_name: str, data: Dict[str, Any]
+    ) -> None:
+        self.events.append((device_id, event_name, data))
+
+
+class FailingSender(SSESenderInterface):
+    async def send_event(
+        self, device_id: str, event_name: str, data: Dict[str, Any]
+    ) -> None:
+        raise ConnectionError("connection closed")
+
+
+@pytest.mark.asyncio
+async def test_send_event_nowait_sends_in_the_background():
+    sender = RecordingSender()
+
+    sender.send_event_nowait("device-1", "status", {"ok": True})
+    assert sender.events == []
+    await _drain()
+
+    assert sender.events == [("device-1", "status", {"ok": True})]
+    assert not sse_interface._background_tasks
+
+
+@pytest.mark.asyncio
+async def test_send_event_raw_nowait_forwards_parsed_frame():
+    sender = RecordingSender()
+
+    sender.send_event_raw_nowait("device-1", b'event: status\ndata: {"ok":true}\n\n')
+    await asyncio.sleep(0)
+
+    assert sender.events == [("device-1", "status", {"ok": True})]
+
+
+@pytest.mark.asyncio
+async def test_background_send_failure_is_logged(caplog):
+    with caplog.at_level(logging.ERROR, logger=sse_interface.__name__):
+        FailingSender().send_event_nowait("device-1", "status", {})
+        await _drain()
+
+    assert "Background SSE send failed" in caplog.text
+    assert not sse_interface._background_tasks
+
+
+def test_send_event_nowait_requires_a_running_loop():
+    with pytest.raises(RuntimeError):
+        RecordingSender().send_event_nowait("device-1", "status", {})